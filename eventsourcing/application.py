@@ -140,7 +140,7 @@ class LocalNotificationLog(NotificationLog):
     retrieved from an :class:`~eventsourcing.persistence.ApplicationRecorder`.
     """
 
-    DEFAULT_SECTION_SIZE = 10
+    DEFAULT_SECTION_SIZE = 100
 
     def __init__(
         self,
@@ -341,7 +341,7 @@ class Application(ABC, Generic[TAggregate]):
         """
         Constructs a :class:`LocalNotificationLog` for use by the application.
         """
-        return LocalNotificationLog(self.recorder, section_size=10)
+        return LocalNotificationLog(self.recorder)
 
     def save(self, *aggregates: Aggregate, **kwargs: Any) -> None:
         """
@@ -283,6 +283,14 @@ class Mapper(Generic[TDomainEvent]):
             state=stored_state,
         )
 
+    def to_domain_events(self, stored: List[StoredEvent]) -> List[TDomainEvent]:
+        """
+        Converts the given list of :class:`StoredEvent` objects
+        to a list of domain event objects, in a single pass.
+        """
+        to_domain_event = self.to_domain_event
+        return [to_domain_event(s) for s in stored]
+
     def to_domain_event(self, stored: StoredEvent) -> TDomainEvent:
         """
         Converts the given :class:`StoredEvent` to a domain event object.
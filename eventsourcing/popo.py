@@ -78,20 +78,26 @@ class POPOAggregateRecorder(AggregateRecorder):
 
 class POPOApplicationRecorder(ApplicationRecorder, POPOAggregateRecorder):
     def select_notifications(self, start: int, limit: int) -> List[Notification]:
+        # Take a slice of the stored events under the lock, and
+        # construct the notifications outside the lock, so that
+        # readers don't block writers whilst notification objects
+        # are being constructed. The stored events list is only
+        # ever appended to, so the sliced items are stable.
+        i = start - 1
+        j = i + limit
         with self.database_lock:
-            results = []
-            i = start - 1
-            j = i + limit
-            for notification_id, s in enumerate(self.stored_events[i:j], start):
-                n = Notification(
-                    id=notification_id,
-                    originator_id=s.originator_id,
-                    originator_version=s.originator_version,
-                    topic=s.topic,
-                    state=s.state,
-                )
-                results.append(n)
-            return results
+            stored_events = self.stored_events[i:j]
+        results = []
+        for notification_id, s in enumerate(stored_events, start):
+            n = Notification(
+                id=notification_id,
+                originator_id=s.originator_id,
+                originator_version=s.originator_version,
+                topic=s.topic,
+                state=s.state,
+            )
+            results.append(n)
+        return results
 
     def max_notification_id(self) -> int:
         with self.database_lock:
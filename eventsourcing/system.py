@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, deque
 from threading import Event, Lock, Thread
 from typing import (
+    Deque,
     Dict,
     Iterable,
     Iterator,
@@ -11,6 +12,7 @@ from typing import (
     Tuple,
     Type,
     TypeVar,
+    Union,
 )
 
 from eventsourcing.application import Application, NotificationLog, Section
@@ -55,6 +57,13 @@ class Follower(Application):
     new domain event notifications through its :func:`policy` method.
     """
 
+    # Prefetching selects subsequent batches of event notifications
+    # on a background thread whilst a batch is being processed. It
+    # must be left disabled when the recorder of a followed application
+    # isn't readable from another thread, such as an SQLite recorder
+    # with a private in-memory database.
+    is_prefetching_enabled: bool = False
+
     def __init__(self) -> None:
         super().__init__()
         self.readers: Dict[
@@ -89,8 +98,11 @@ class Follower(Application):
         Pulls and processes unseen domain event notifications
         from the notification log reader of the names application.
 
-        Converts received event notifications to domain
-        event objects, and then calls the :func:`policy`
+        Pulls batches of event notifications, with subsequent
+        batches prefetched whilst a batch is being processed
+        if :data:`is_prefetching_enabled` is set on the class,
+        and converts each batch of received event notifications
+        to domain event objects, and then calls the :func:`policy`
         with a new :class:`ProcessEvent` object which
         contains a :class:`~eventsourcing.persistence.Tracking`
         object that keeps track of the name of the application
@@ -101,23 +113,42 @@ class Follower(Application):
         domain events using the aggregates'
         :func:`~eventsourcing.domain.Aggregate.collect_events`
         method, and the process event object will then be recorded
-        by calling the :func:`record` method.
+        by calling the :func:`record` method. After a batch has been
+        processed and recorded, the :func:`~Leader.notify` method is
+        called once with all the new domain events from the batch, so
+        that followers are prompted once per batch rather than once
+        per process event.
         """
         reader, mapper = self.readers[name]
         start = self.recorder.max_tracking_id(name) + 1
-        for notification in reader.select(start=start):
-            domain_event = mapper.to_domain_event(notification)
-            process_event = ProcessEvent(
+        # Hoist bound methods out of the loops below, so that
+        # processing each notification loads locals rather than
+        # doing attribute lookups.
+        policy = self.policy
+        record = self.record
+        if self.is_prefetching_enabled:
+            batches = reader.prefetch_batches(start=start)
+        else:
+            batches = reader.select_batches(start=start)
+        for notifications in batches:
+            domain_events = mapper.to_domain_events(notifications)
+            trackings = [
                 Tracking(
                     application_name=name,
                     notification_id=notification.id,
                 )
-            )
-            self.policy(
-                domain_event,
-                process_event,
-            )
-            self.record(process_event)
+                for notification in notifications
+            ]
+            new_events: List[AggregateEvent] = []
+            for domain_event, tracking in zip(domain_events, trackings):
+                process_event = ProcessEvent(tracking)
+                policy(
+                    domain_event,
+                    process_event,
+                )
+                record(process_event)
+                new_events += process_event.events
+            self.notify(new_events)
 
     @abstractmethod
     def policy(
@@ -141,11 +172,17 @@ class Follower(Application):
     def record(self, process_event: ProcessEvent) -> None:
         """
         Records given process event in the application's process recorder.
+
+        The application's :func:`~eventsourcing.application.Application.notify`
+        method is not called here, but rather once for each batch of process
+        events recorded by :func:`pull_and_process`, so that followers are
+        prompted once for a batch of new domain events, rather than once
+        for each recorded process event.
         """
         self.events.put(
-            **process_event.__dict__,
+            process_event.events,
+            tracking=process_event.tracking,
         )
-        self.notify(process_event.events)
 
 
 class Promptable(ABC):
@@ -171,6 +208,9 @@ class Leader(Application):
 
     def __init__(self) -> None:
         super().__init__()
+        # The name is sent to followers as the prompt, so
+        # construct it once here rather than once per prompt.
+        self.name = self.__class__.__name__
         self.followers: List[Promptable] = []
 
     def lead(self, follower: Promptable) -> None:
@@ -186,7 +226,10 @@ class Leader(Application):
         been saved.
         """
         super().notify(new_events)
-        if len(new_events):
+        # Don't bother prompting unless there are followers,
+        # so that terminal nodes in a system don't pay for
+        # the prompting machinery on every saved event.
+        if len(new_events) and len(self.followers):
             self.prompt_followers()
 
     def prompt_followers(self) -> None:
@@ -194,9 +237,8 @@ class Leader(Application):
         Prompts followers by calling their :func:`~Promptable.receive_prompt`
         methods with the name of the application.
         """
-        name = self.__class__.__name__
         for follower in self.followers:
-            follower.receive_prompt(name)
+            follower.receive_prompt(self.name)
 
 
 class ProcessApplication(Leader, Follower, ABC):
@@ -236,9 +278,8 @@ class System:
 
         self.edges = list(edges)
         self.nodes: Dict[str, str] = {}
-        for name in nodes:
-            topic = get_topic(nodes[name])
-            self.nodes[name] = topic
+        for name, cls in nodes.items():
+            self.nodes[name] = get_topic(cls)
         # Identify leaders and followers.
         self.follows: Dict[str, List[str]] = defaultdict(list)
         self.leads: Dict[str, List[str]] = defaultdict(list)
@@ -248,13 +289,15 @@ class System:
 
         # Check followers are followers.
         for name in self.follows:
-            if not issubclass(nodes[name], Follower):
-                raise TypeError("Not a follower class: %s" % nodes[name])
+            follower_class = nodes[name]
+            if not issubclass(follower_class, Follower):
+                raise TypeError("Not a follower class: %s" % follower_class)
 
         # Check each process is a process application class.
         for name in self.processors:
-            if not issubclass(nodes[name], ProcessApplication):
-                raise TypeError("Not a process application class: %s" % nodes[name])
+            process_class = nodes[name]
+            if not issubclass(process_class, ProcessApplication):
+                raise TypeError("Not a process application class: %s" % process_class)
 
     @property
     def leaders(self) -> Iterable[str]:
@@ -385,7 +428,7 @@ class SingleThreadedRunner(Runner, Promptable):
             assert isinstance(leader, Leader)
             assert isinstance(follower, Follower)
             leader.lead(self)
-            follower.follow(leader.__class__.__name__, leader.log)
+            follower.follow(leader.name, leader.log)
 
     def receive_prompt(self, leader_name: str) -> None:
         """
@@ -393,19 +436,24 @@ class SingleThreadedRunner(Runner, Promptable):
         leader to list of prompted names.
         Unless this method has previously been called but not
         yet returned, it will then proceed to forward the prompts
-        received to its application by calling the application's
-        :func:`~Follower.pull_and_process` method for each prompted name.
+        received to its application by draining the list of prompted
+        names in batches, and calling the application's
+        :func:`~Follower.pull_and_process` method once for each
+        prompted name in a batch. Draining the list in batches means
+        prompts received whilst a batch is being processed are
+        dispatched together in the next batch.
         """
         if leader_name not in self.prompts_received:
             self.prompts_received.append(leader_name)
         if not self.is_prompting:
             self.is_prompting = True
             while self.prompts_received:
-                prompt = self.prompts_received.pop(0)
-                for name in self.system.leads[prompt]:
-                    follower = self.apps[name]
-                    assert isinstance(follower, Follower)
-                    follower.pull_and_process(prompt)
+                prompts, self.prompts_received = self.prompts_received, []
+                for prompt in prompts:
+                    for name in self.system.leads[prompt]:
+                        follower = self.apps[name]
+                        assert isinstance(follower, Follower)
+                        follower.pull_and_process(prompt)
             self.is_prompting = False
 
     def stop(self) -> None:
@@ -423,13 +471,29 @@ class MultiThreadedRunner(Runner):
     follower in the system definition.
     It is a runner, and so implements the :func:`start`, :func:`stop`,
     and :func:`get` methods.
+
+    Each follower is served by exactly one thread, which blocks until
+    prompted (or until the poll interval elapses) and otherwise does
+    no work, plus a transient prefetch thread whilst a multi-batch
+    pull is in progress for a follower that has prefetching enabled.
+    Because applications, recorders and policies
+    present blocking interfaces, the threads spend their time either
+    waiting on events or doing useful work, and there is no benefit
+    in consolidating them onto a single cooperative event loop.
     """
 
-    def __init__(self, system: System):
+    def __init__(self, system: System, poll_interval: Optional[float] = None):
         """
-        Initialises runner with the given :class:`System`.
+        Initialises runner with the given :class:`System`, and
+        optionally a poll interval (in seconds). If a poll interval
+        is given, each runner thread will periodically pull from the
+        notification logs it is following, in addition to pulling
+        when prompted, so that event notifications are processed
+        even if a prompt is never received. Otherwise, the runner
+        threads will block until prompted.
         """
         super().__init__(system)
+        self.poll_interval = poll_interval
         self.apps: Dict[str, Application] = {}
         self.threads: Dict[str, MultiThreadedRunnerThread] = {}
         self.is_stopping = Event()
@@ -448,18 +512,24 @@ class MultiThreadedRunner(Runner):
         """
         super().start()
 
-        # Construct followers.
+        # Construct followers. Start all the threads before waiting
+        # for any of them, so the applications are constructed in
+        # parallel rather than one after another.
         for name in self.system.followers:
             app_class = self.system.follower_cls(name)
             thread = MultiThreadedRunnerThread(
                 app_class=app_class,
                 is_stopping=self.is_stopping,
+                poll_interval=self.poll_interval,
             )
             self.threads[name] = thread
             thread.start()
+        for name, thread in self.threads.items():
             if (not thread.is_running.wait(timeout=5)) or thread.has_stopped.is_set():
                 self.stop()
-                raise Exception(f"Thread for '{app_class.__name__}' failed to start")
+                raise Exception(
+                    f"Thread for '{thread.app_class.__name__}' failed to start"
+                )
             self.apps[name] = thread.app
 
         # Construct non-follower leaders.
@@ -473,14 +543,18 @@ class MultiThreadedRunner(Runner):
             follower = self.apps[edge[1]]
             assert isinstance(leader, Leader)
             assert isinstance(follower, Follower)
-            follower.follow(leader.__class__.__name__, leader.log)
+            follower.follow(leader.name, leader.log)
             thread = self.threads[edge[1]]
             leader.lead(thread)
 
     def stop(self) -> None:
         self.is_stopping.set()
+        # Wake all the threads before joining any of them, so that
+        # stopping doesn't wait on each thread in turn to notice
+        # the runner is stopping.
         for thread in self.threads.values():
             thread.is_prompted.set()
+        for thread in self.threads.values():
             thread.join()
 
     @property
@@ -516,16 +590,18 @@ class MultiThreadedRunnerThread(Promptable, Thread):
         self,
         app_class: Type[Follower],
         is_stopping: Event,
+        poll_interval: Optional[float] = None,
     ):
-        super().__init__()
+        super().__init__(name="{}-thread".format(app_class.__name__))
         self.app_class = app_class
         self.is_stopping = is_stopping
+        self.poll_interval = poll_interval
         self.has_stopped = Event()
         self.has_errored = Event()
         self.is_prompted = Event()
         self.prompted_names: List[str] = []
         self.prompted_names_lock = Lock()
-        self.setDaemon(True)
+        self.daemon = True
         self.is_running = Event()
 
     def run(self) -> None:
@@ -533,9 +609,12 @@ class MultiThreadedRunnerThread(Promptable, Thread):
         Begins by constructing an application instance from
         given application class and then loops forever until
         stopped. The loop blocks on waiting for the 'is_prompted'
-        event to be set, then forwards the prompts already received
-        to its application by calling the application's
-        :func:`~Follower.pull_and_process` method for each prompted name.
+        event to be set, or until the poll interval elapses if a
+        poll interval was given, then forwards the prompts already
+        received to its application by calling the application's
+        :func:`~Follower.pull_and_process` method for each prompted
+        name, or for each followed name if the poll interval elapsed
+        without a prompt being received.
         """
         try:
             self.app: Follower = self.app_class()
@@ -549,14 +628,20 @@ class MultiThreadedRunnerThread(Promptable, Thread):
 
         try:
             while True:
-                self.is_prompted.wait()
+                self.is_prompted.wait(timeout=self.poll_interval)
                 if self.is_stopping.is_set():
                     self.has_stopped.set()
                     break
+                # Clear the event before taking the prompted names, so
+                # that a prompt received after the names are taken sets
+                # the event again and is processed on the next loop.
+                self.is_prompted.clear()
                 with self.prompted_names_lock:
-                    prompted_names = self.prompted_names
-                    self.prompted_names = []
-                    self.is_prompted.clear()
+                    prompted_names, self.prompted_names = self.prompted_names, []
+                if not prompted_names and self.poll_interval is not None:
+                    # The wait timed out, so poll all the
+                    # applications being followed.
+                    prompted_names = list(self.app.readers.keys())
                 for name in prompted_names:
                     self.app.pull_and_process(name)
         except Exception:
@@ -573,7 +658,9 @@ class MultiThreadedRunnerThread(Promptable, Thread):
         with self.prompted_names_lock:
             if leader_name not in self.prompted_names:
                 self.prompted_names.append(leader_name)
-            self.is_prompted.set()
+        # Set the event outside the lock, so the runner thread
+        # isn't woken up only to block on the lock.
+        self.is_prompted.set()
 
 
 class NotificationLogReader:
@@ -581,7 +668,8 @@ class NotificationLogReader:
     Reads domain event notifications from a notification log.
     """
 
-    DEFAULT_SECTION_SIZE = 10
+    DEFAULT_SECTION_SIZE = 100
+    PRE_FETCH_LIMIT = 2
 
     def __init__(
         self,
@@ -639,11 +727,119 @@ class NotificationLogReader:
         in the notification log from the start position have been
         yielded.
         """
-        while True:
-            notifications = self.notification_log.select(start, self.section_size)
+        for notifications in self.select_batches(start=start):
             for notification in notifications:
                 yield notification
+
+    def select_batches(self, *, start: int) -> Iterator[List[Notification]]:
+        """
+        Returns a generator that yields batches of event notifications
+        from the reader's notification log, starting from
+        given start position (a notification ID).
+
+        This method selects a limited list of notifications from a
+        notification log and yields the whole list, so that each batch
+        of event notifications selected from the notification log can
+        be processed together, rather than one event notification at
+        a time. The reader will continue to retrieve and yield lists
+        until all subsequent event notifications in the notification
+        log from the start position have been yielded.
+        """
+        while True:
+            notifications = self.notification_log.select(start, self.section_size)
+            if notifications:
+                yield notifications
             if len(notifications) < self.section_size:
                 break
             else:
                 start = notifications[-1].id + 1
+
+    def prefetch_batches(self, *, start: int) -> Iterator[List[Notification]]:
+        """
+        Returns a generator that yields batches of event notifications
+        from the reader's notification log, starting from
+        given start position (a notification ID), like
+        :func:`select_batches`, but selecting subsequent batches ahead
+        of them being consumed.
+
+        The first batch is selected directly, and if it is a full batch,
+        so that there may be more event notifications in the notification
+        log, subsequent batches are selected in a background thread whilst
+        previously yielded batches are being consumed. This overlaps
+        retrieving event notifications from the notification log, which
+        may involve a remote call, with the processing of a previous
+        batch. If the generator is closed, or discarded, before it has
+        been fully iterated, the background thread is cancelled, so
+        that it finishes rather than blocking forever on a full buffer.
+        """
+        notifications = self.notification_log.select(start, self.section_size)
+        if notifications:
+            yield notifications
+        if len(notifications) < self.section_size:
+            return
+        start = notifications[-1].id + 1
+
+        # The background thread is the only producer, and this
+        # generator is the only consumer, so the buffer of batches
+        # can be a deque, whose append and popleft operations are
+        # atomic under the GIL, with events to signal the buffer
+        # becoming non-empty and becoming non-full, avoiding the
+        # mutex and condition variables of a queue.Queue.
+        buffer: Deque[Union[List[Notification], Exception, None]] = deque()
+        is_not_empty = Event()
+        is_not_full = Event()
+        is_cancelled = Event()
+
+        def fetch_batches() -> None:
+            def put(item: Union[List[Notification], Exception, None]) -> bool:
+                while len(buffer) >= self.PRE_FETCH_LIMIT:
+                    is_not_full.clear()
+                    # Check for cancellation after clearing the event,
+                    # because cancelling sets 'is_cancelled' before
+                    # 'is_not_full', so either this check sees the
+                    # cancellation or the wait below is woken by it.
+                    if is_cancelled.is_set():
+                        return False
+                    if len(buffer) >= self.PRE_FETCH_LIMIT:
+                        is_not_full.wait()
+                buffer.append(item)
+                is_not_empty.set()
+                return True
+
+            try:
+                for batch in self.select_batches(start=start):
+                    if not put(batch):
+                        return
+            except Exception as e:
+                put(e)
+            else:
+                put(None)
+
+        thread = Thread(
+            target=fetch_batches,
+            daemon=True,
+            name="{}-prefetch".format(type(self.notification_log).__name__),
+        )
+        thread.start()
+        try:
+            while True:
+                try:
+                    item = buffer.popleft()
+                except IndexError:
+                    is_not_empty.clear()
+                    if not buffer:
+                        is_not_empty.wait()
+                    continue
+                is_not_full.set()
+                if item is None:
+                    break
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            # Cancel the background thread, in case the generator is
+            # being closed before it has been fully iterated, so the
+            # thread isn't left blocking on a full buffer.
+            is_cancelled.set()
+            is_not_full.set()
@@ -48,6 +48,12 @@ class TestMapper(TestCase):
         # Map to domain event.
         copy = mapper.to_domain_event(stored_event)
 
+        # Map a batch to domain events.
+        copies = mapper.to_domain_events([stored_event, stored_event])
+        assert len(copies) == 2
+        assert copies[0].originator_id == domain_event.originator_id
+        assert copies[1].originator_id == domain_event.originator_id
+
         # Check values are not visible.
         assert "Alice" not in str(stored_event.state)
 
@@ -1,3 +1,5 @@
+import threading
+from time import sleep
 from unittest.case import TestCase
 from uuid import uuid4
 
@@ -123,3 +125,139 @@ class TestNotificationLogReader(TestCase):
 
         notifications = list(reader.select(start=10))
         self.assertEqual(len(notifications), 0)
+
+    def test_select_batches(self):
+        recorder = SQLiteProcessRecorder(SQLiteDatastore(":memory:"))
+        recorder.create_table()
+
+        # Construct notification log.
+        notification_log = LocalNotificationLog(recorder, section_size=5)
+        reader = NotificationLogReader(notification_log, section_size=5)
+        batches = list(reader.select_batches(start=1))
+        self.assertEqual(len(batches), 0)
+
+        # Write 5 events.
+        originator_id = uuid4()
+        for i in range(5):
+            stored_event = StoredEvent(
+                originator_id=originator_id,
+                originator_version=i,
+                topic="topic",
+                state=b"state",
+            )
+            recorder.insert_events(
+                [stored_event],
+            )
+
+        batches = list(reader.select_batches(start=1))
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(batches[0]), 5)
+
+        # Write 4 events.
+        originator_id = uuid4()
+        for i in range(4):
+            stored_event = StoredEvent(
+                originator_id=originator_id,
+                originator_version=i,
+                topic="topic",
+                state=b"state",
+            )
+            recorder.insert_events([stored_event])
+
+        batches = list(reader.select_batches(start=1))
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(len(batches[0]), 5)
+        self.assertEqual(len(batches[1]), 4)
+
+        batches = list(reader.select_batches(start=6))
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(batches[0]), 4)
+
+        batches = list(reader.select_batches(start=10))
+        self.assertEqual(len(batches), 0)
+
+    def test_prefetch_batches(self):
+        # Use shared cache so the database is readable
+        # from the reader's background thread.
+        recorder = SQLiteProcessRecorder(
+            SQLiteDatastore("file::memory:?mode=memory&cache=shared")
+        )
+        recorder.create_table()
+
+        # Construct notification log.
+        notification_log = LocalNotificationLog(recorder, section_size=5)
+        reader = NotificationLogReader(notification_log, section_size=5)
+        batches = list(reader.prefetch_batches(start=1))
+        self.assertEqual(len(batches), 0)
+
+        # Write 14 events.
+        originator_id = uuid4()
+        for i in range(14):
+            stored_event = StoredEvent(
+                originator_id=originator_id,
+                originator_version=i,
+                topic="topic",
+                state=b"state",
+            )
+            recorder.insert_events(
+                [stored_event],
+            )
+
+        batches = list(reader.prefetch_batches(start=1))
+        self.assertEqual(len(batches), 3)
+        self.assertEqual(len(batches[0]), 5)
+        self.assertEqual(len(batches[1]), 5)
+        self.assertEqual(len(batches[2]), 4)
+        self.assertEqual(
+            [n.id for batch in batches for n in batch],
+            list(range(1, 15)),
+        )
+
+        batches = list(reader.prefetch_batches(start=11))
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(batches[0]), 4)
+
+        batches = list(reader.prefetch_batches(start=15))
+        self.assertEqual(len(batches), 0)
+
+    def test_prefetch_batches_closed_early(self):
+        # Use shared cache so the database is readable
+        # from the reader's background thread.
+        recorder = SQLiteProcessRecorder(
+            SQLiteDatastore("file::memory:?mode=memory&cache=shared")
+        )
+        recorder.create_table()
+
+        # Construct notification log.
+        notification_log = LocalNotificationLog(recorder, section_size=5)
+        reader = NotificationLogReader(notification_log, section_size=5)
+
+        # Write 25 events.
+        originator_id = uuid4()
+        for i in range(25):
+            stored_event = StoredEvent(
+                originator_id=originator_id,
+                originator_version=i,
+                topic="topic",
+                state=b"state",
+            )
+            recorder.insert_events(
+                [stored_event],
+            )
+
+        # Consume two batches and then close the generator,
+        # whilst the background thread still has batches to put.
+        batches = reader.prefetch_batches(start=1)
+        self.assertEqual(len(next(batches)), 5)
+        self.assertEqual(len(next(batches)), 5)
+        batches.close()
+
+        # Check the background thread terminates.
+        for _ in range(100):
+            threads = [
+                t for t in threading.enumerate() if t.name.endswith("-prefetch")
+            ]
+            if not threads:
+                break
+            sleep(0.01)
+        self.assertEqual(threads, [])
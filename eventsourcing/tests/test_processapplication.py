@@ -1,3 +1,4 @@
+import os
 from unittest.case import TestCase
 
 from eventsourcing.dispatch import singledispatchmethod
@@ -55,6 +56,66 @@ class TestProcessApplication(TestCase):
         section = notifications.log["1,5"]
         self.assertEqual(len(section.items), 2)
 
+    def test_pull_and_process_with_prefetching_enabled(self):
+        leader_cls = type(
+            BankAccounts.__name__,
+            (BankAccounts, Leader),
+            {},
+        )
+
+        accounts = leader_cls()
+        notifications = PrefetchingEmailNotifications()
+        notifications.follow(
+            accounts.__class__.__name__,
+            accounts.log,
+        )
+
+        # Write more than one batch of notifications,
+        # so that the prefetch thread is used.
+        for i in range(105):
+            accounts.open_account("Alice {}".format(i), "alice@example.com")
+
+        notifications.pull_and_process("BankAccounts")
+
+        self.assertEqual(
+            notifications.recorder.max_tracking_id("BankAccounts"), 105
+        )
+
+    def test_pull_and_process_with_sqlite_memory_db(self):
+        # Check a multi-batch pull works when the notification
+        # log is backed by a private in-memory SQLite database,
+        # which isn't readable from another thread (prefetching
+        # is disabled by default).
+        os.environ["INFRASTRUCTURE_FACTORY"] = "eventsourcing.sqlite:Factory"
+        os.environ["BANKACCOUNTS_SQLITE_DBNAME"] = ":memory:"
+        os.environ["EMAILNOTIFICATIONS_SQLITE_DBNAME"] = ":memory:"
+        try:
+            leader_cls = type(
+                BankAccounts.__name__,
+                (BankAccounts, Leader),
+                {},
+            )
+
+            accounts = leader_cls()
+            notifications = EmailNotifications()
+            notifications.follow(
+                accounts.__class__.__name__,
+                accounts.log,
+            )
+
+            for i in range(105):
+                accounts.open_account("Alice {}".format(i), "alice@example.com")
+
+            notifications.pull_and_process("BankAccounts")
+
+            self.assertEqual(
+                notifications.recorder.max_tracking_id("BankAccounts"), 105
+            )
+        finally:
+            del os.environ["INFRASTRUCTURE_FACTORY"]
+            del os.environ["BANKACCOUNTS_SQLITE_DBNAME"]
+            del os.environ["EMAILNOTIFICATIONS_SQLITE_DBNAME"]
+
 
 class EmailNotifications(ProcessApplication):
     def register_transcodings(self, transcoder: Transcoder) -> None:
@@ -84,6 +145,10 @@ class EmailNotifications(ProcessApplication):
         process_event.save(notification)
 
 
+class PrefetchingEmailNotifications(EmailNotifications):
+    is_prefetching_enabled = True
+
+
 class PromptForwarder(Promptable):
     def __init__(self, application: Follower):
         self.application = application
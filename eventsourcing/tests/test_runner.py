@@ -142,6 +142,38 @@ class TestMultiThreadedRunner(RunnerTestCase):
 
         self.assertTrue(runner.has_stopped)
 
+    def test_poll_interval_pulls_without_prompts(self):
+        system = System(
+            pipes=[
+                [
+                    BankAccounts,
+                    EmailNotifications,
+                ],
+            ]
+        )
+
+        runner = self.runner_class(system, poll_interval=0.05)
+        runner.start()
+
+        accounts = runner.get(BankAccounts)
+        notifications = runner.get(EmailNotifications)
+
+        # Disconnect the prompts, so event notifications
+        # are only noticed by polling.
+        accounts.followers.clear()
+
+        accounts.open_account(
+            full_name="Alice",
+            email_address="alice@example.com",
+        )
+
+        sleep(0.3)
+
+        section = notifications.log["1,5"]
+        self.assertEqual(len(section.items), 1)
+
+        runner.stop()
+
     def test_prompts_received_doesnt_accumulate_names(self):
         system = System(
             pipes=[
@@ -121,6 +121,26 @@ class TestRetryDecorator(TestCase):
             def f():
                 pass
 
+    def test_max_wait(self):
+        self.call_count = 0
+
+        @retry(ValueError, max_attempts=3, wait=0.001, max_wait=0.002)
+        def f():
+            self.call_count += 1
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            f()
+
+        self.assertEqual(self.call_count, 3)
+
+    def test_max_wait_not_float(self):
+        with self.assertRaises(TypeError):
+
+            @retry(ValueError, max_attempts=1, max_wait="a")
+            def f():
+                pass
+
 
 class TestStrtobool(TestCase):
     def test_true_values(self):
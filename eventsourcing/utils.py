@@ -61,15 +61,23 @@ def retry(
     max_attempts: int = 1,
     wait: float = 0,
     stall: float = 0,
+    max_wait: float = 60,
     verbose: bool = False,
 ) -> Callable:
     """
     Retry decorator.
 
+    The wait between attempts is doubled after each failed attempt, up
+    to the given maximum wait, and the actual time slept is drawn
+    uniformly between zero and the current wait, so that callers that
+    fail together don't all retry together.
+
     :param exc: List of exceptions that will cause the call to be retried if raised.
     :param max_attempts: Maximum number of attempts to try.
-    :param wait: Amount of time to wait before retrying after an exception.
+    :param wait: Initial amount of time to wait before retrying after an exception,
+        doubled after each failed attempt and randomly jittered.
     :param stall: Amount of time to wait before the first attempt.
+    :param max_wait: Maximum amount of time to wait before retrying.
     :param verbose: If True, prints a message to STDOUT when retries occur.
     :return: Returns the value returned by decorated function.
     """
@@ -87,7 +95,8 @@ def retry(
                 except exc as e:
                     attempts += 1
                     if max_attempts is None or attempts < max_attempts:
-                        sleep(wait * (1 + 0.1 * (random() - 0.5)))
+                        backoff = min(max_wait, wait * 2 ** (attempts - 1))
+                        sleep(backoff * random())
                     else:
                         # Max retries exceeded.
                         raise e
@@ -119,6 +128,8 @@ def retry(
             raise TypeError("'wait' must be a float: {}".format(max_attempts))
         if not isinstance(stall, (float, int)):
             raise TypeError("'stall' must be a float: {}".format(max_attempts))
+        if not isinstance(max_wait, (float, int)):
+            raise TypeError("'max_wait' must be a float: {}".format(max_wait))
         return _retry
 
 